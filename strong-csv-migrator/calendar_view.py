@@ -8,8 +8,20 @@ of workouts for easy QA/verification.
 
 import argparse
 import csv
+import sys
 from collections import defaultdict
-from datetime import datetime
+from datetime import date
+from itertools import chain, pairwise
+
+# Fixed English names (matches strftime('%a') / strftime('%B') in the C locale)
+DAY_ABBR = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+# Read buffer for the input CSV (default is 8 KiB)
+_IO_BUFFER_SIZE = 1 << 20
 
 
 def parse_strong_csv(filepath: str) -> dict:
@@ -22,14 +34,36 @@ def parse_strong_csv(filepath: str) -> dict:
     Returns:
         Dict mapping date string to list of workout types
     """
-    workouts_by_date = defaultdict(set)
+    # Most dates have one or two workouts, so a deduplicated list beats a set
+    workouts_by_date = {}
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f, delimiter=';')
-        for row in reader:
-            date_str = row['Date'].split()[0]  # Get just the date part (YYYY-MM-DD)
-            workout_name = row['Workout Name']
-            workouts_by_date[date_str].add(workout_name)
+    with open(filepath, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+        header_line = next(f, None)
+        if header_line is None:
+            return workouts_by_date
+        
+        header = next(csv.reader([header_line], delimiter=';'))
+        date_idx = header.index('Date')
+        name_idx = header.index('Workout Name')
+        
+        # Only split as far as the columns we need; notes etc. are left unscanned
+        max_split = max(date_idx, name_idx) + 1
+        
+        for line in f:
+            if '"' in line:
+                # Quoted fields can hide delimiters or span lines, so let csv handle them
+                row = next(csv.reader(chain([line], f), delimiter=';'), [])
+            else:
+                row = line.rstrip('\n').split(';', max_split)
+            if len(row) < max_split:
+                continue
+            date_str = row[date_idx][:10]  # Get just the date part (YYYY-MM-DD)
+            workout_name = row[name_idx]
+            names = workouts_by_date.get(date_str)
+            if names is None:
+                workouts_by_date[date_str] = [workout_name]
+            elif workout_name not in names:
+                names.append(workout_name)
     
     return workouts_by_date
 
@@ -39,56 +73,58 @@ def print_calendar_view(workouts_by_date: dict, start_date: str = None, end_date
     Print a calendar view of workouts.
     
     Args:
-        workouts_by_date: Dict mapping date to set of workout names
+        workouts_by_date: Dict mapping date to list of workout names
         start_date: Optional start date filter (YYYY-MM-DD)
         end_date: Optional end date filter (YYYY-MM-DD)
     """
-    # Get all dates and sort them
-    all_dates = sorted(workouts_by_date.keys())
-    
-    if not all_dates:
+    if not workouts_by_date:
         print("No workouts found.")
         return
     
-    # Apply date filters
-    if start_date:
-        all_dates = [d for d in all_dates if d >= start_date]
-    if end_date:
-        all_dates = [d for d in all_dates if d <= end_date]
+    # Apply date filters in a single pass (ISO dates compare correctly as strings)
+    lo = start_date or ''
+    hi = end_date or '9999-99-99'
+    all_dates = [d for d in workouts_by_date if lo <= d <= hi]
+    all_dates.sort()
     
     if not all_dates:
         print(f"No workouts found between {start_date} and {end_date}")
         return
     
-    print(f"\n{'='*80}")
-    print(f"WORKOUT CALENDAR VIEW")
-    print(f"{'='*80}")
-    print(f"Date Range: {all_dates[0]} to {all_dates[-1]}")
-    print(f"Total Workout Days: {len(all_dates)}")
-    print(f"{'='*80}\n")
+    # Collect all lines and write them in one go instead of a print() per line
+    out = [
+        f"\n{'='*80}",
+        f"WORKOUT CALENDAR VIEW",
+        f"{'='*80}",
+        f"Date Range: {all_dates[0]} to {all_dates[-1]}",
+        f"Total Workout Days: {len(all_dates)}",
+        f"{'='*80}\n",
+    ]
     
     current_month = None
     
     for date_str in all_dates:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        month_year = date_obj.strftime('%B %Y')
+        date_obj = date.fromisoformat(date_str)
+        month_key = (date_obj.year, date_obj.month)
         
         # Print month header when month changes
-        if month_year != current_month:
+        if month_key != current_month:
             if current_month is not None:
-                print()  # Blank line between months
-            print(f"\n{month_year}")
-            print("-" * 60)
-            current_month = month_year
+                out.append("")  # Blank line between months
+            out.append(f"\n{MONTH_NAMES[date_obj.month - 1]} {date_obj.year}")
+            out.append("-" * 60)
+            current_month = month_key
         
-        # Format workout names
-        workouts = sorted(workouts_by_date[date_str])
-        workout_str = ", ".join(workouts)
+        # Format workout names (nearly every date has a single workout, no sort needed)
+        workouts = workouts_by_date[date_str]
+        workout_str = workouts[0] if len(workouts) == 1 else ", ".join(sorted(workouts))
         
         # Get day of week
-        day_name = date_obj.strftime('%a')
+        day_name = DAY_ABBR[date_obj.weekday()]
         
-        print(f"{date_str} ({day_name:>3}): {workout_str}")
+        out.append(f"{date_str} ({day_name:>3}): {workout_str}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def print_summary(workouts_by_date: dict):
@@ -96,7 +132,7 @@ def print_summary(workouts_by_date: dict):
     Print summary statistics.
     
     Args:
-        workouts_by_date: Dict mapping date to set of workout names
+        workouts_by_date: Dict mapping date to list of workout names
     """
     all_dates = sorted(workouts_by_date.keys())
     
@@ -111,23 +147,27 @@ def print_summary(workouts_by_date: dict):
             workout_type_counts[workout] += 1
     
     # Find gaps (missing days between first and last workout)
-    start_date = datetime.strptime(all_dates[0], '%Y-%m-%d')
-    end_date = datetime.strptime(all_dates[-1], '%Y-%m-%d')
+    start_date = date.fromisoformat(all_dates[0])
+    end_date = date.fromisoformat(all_dates[-1])
     total_days = (end_date - start_date).days + 1
     workout_days = len(all_dates)
     rest_days = total_days - workout_days
     
-    print(f"\n{'='*80}")
-    print(f"SUMMARY STATISTICS")
-    print(f"{'='*80}")
-    print(f"Date Range: {all_dates[0]} to {all_dates[-1]}")
-    print(f"Total Days in Range: {total_days}")
-    print(f"Workout Days: {workout_days}")
-    print(f"Rest Days: {rest_days}")
-    print(f"\nWorkout Type Breakdown:")
+    out = [
+        f"\n{'='*80}",
+        f"SUMMARY STATISTICS",
+        f"{'='*80}",
+        f"Date Range: {all_dates[0]} to {all_dates[-1]}",
+        f"Total Days in Range: {total_days}",
+        f"Workout Days: {workout_days}",
+        f"Rest Days: {rest_days}",
+        f"\nWorkout Type Breakdown:",
+    ]
     for workout_type, count in sorted(workout_type_counts.items()):
-        print(f"  {workout_type}: {count} days")
-    print(f"{'='*80}\n")
+        out.append(f"  {workout_type}: {count} days")
+    out.append(f"{'='*80}\n")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def find_gaps(workouts_by_date: dict, min_gap_days: int = 7):
@@ -135,7 +175,7 @@ def find_gaps(workouts_by_date: dict, min_gap_days: int = 7):
     Find gaps of N or more days without workouts.
     
     Args:
-        workouts_by_date: Dict mapping date to set of workout names
+        workouts_by_date: Dict mapping date to list of workout names
         min_gap_days: Minimum gap size to report (default 7 days)
     """
     all_dates = sorted(workouts_by_date.keys())
@@ -143,23 +183,25 @@ def find_gaps(workouts_by_date: dict, min_gap_days: int = 7):
     if len(all_dates) < 2:
         return
     
-    gaps = []
+    # Parse each date once; consecutive ordinals differ by the number of days
+    ordinals = [date.fromisoformat(d).toordinal() for d in all_dates]
     
-    for i in range(len(all_dates) - 1):
-        current_date = datetime.strptime(all_dates[i], '%Y-%m-%d')
-        next_date = datetime.strptime(all_dates[i + 1], '%Y-%m-%d')
-        gap_days = (next_date - current_date).days - 1
-        
-        if gap_days >= min_gap_days:
-            gaps.append((all_dates[i], all_dates[i + 1], gap_days))
+    gaps = [
+        (all_dates[i], all_dates[i + 1], gap_days)
+        for i, gap_days in enumerate(b - a - 1 for a, b in pairwise(ordinals))
+        if gap_days >= min_gap_days
+    ]
     
     if gaps:
-        print(f"\n{'='*80}")
-        print(f"GAPS ({min_gap_days}+ days without workouts)")
-        print(f"{'='*80}")
+        out = [
+            f"\n{'='*80}",
+            f"GAPS ({min_gap_days}+ days without workouts)",
+            f"{'='*80}",
+        ]
         for start, end, days in gaps:
-            print(f"{start} to {end}: {days} day gap")
-        print(f"{'='*80}\n")
+            out.append(f"{start} to {end}: {days} day gap")
+        out.append(f"{'='*80}\n")
+        sys.stdout.write("\n".join(out) + "\n")
     else:
         print(f"\nNo gaps of {min_gap_days}+ days found.\n")
 
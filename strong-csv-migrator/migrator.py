@@ -8,11 +8,58 @@ for import into Hevy app.
 
 import argparse
 import csv
+import heapq
+import os
 import re
+from collections import namedtuple
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
-# Exercise name mapping - grouped by Hevy name with source name variations
-EXERCISE_NAME_MAP = {
+# Read/write buffer for the CSV files (default is 8 KiB)
+_IO_BUFFER_SIZE = 1 << 20
+
+# Worker processes only pay off once there is this much input to parse; below
+# it (the bundled spreadsheets are ~20 KB each) process start-up dominates
+_PARALLEL_MIN_BYTES = 4 << 20
+
+# Matches week header cells like "Week 1" or "Week 12 (8/4 - 8/10)"
+_WEEK_RE = re.compile(r'Week\s*(\d+)', re.IGNORECASE)
+
+# Plain decimal numbers like "135", "22.5" or "-10" (checked before float())
+_FLOAT_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)')
+
+# Characters that force csv.writer to quote a field in the Strong CSV output
+_NEEDS_QUOTING_RE = re.compile(r'[;"\r\n]')
+
+# Common spellings of the completed flag and YES/NO note markers; anything
+# else falls back to strip().upper() so unusual casing is still handled
+_COMPLETED_FLAGS = {
+    'TRUE': True, 'True': True, 'true': True,
+    'FALSE': False, 'False': False, 'false': False, '': False,
+}
+_NOTE_MARKERS = frozenset({'', 'YES', 'Yes', 'yes', 'NO', 'No', 'no'})
+
+# Workout day headers as they appear in the source spreadsheets (plus any
+# "Day ..." row). Push/Pull/Legs only count when bare or lettered, so exercise
+# rows like "Pullover", "Push Press" or "Pull Up" are never taken as headers.
+_DAY_HEADERS = frozenset({
+    'Upper', 'Lower', 'Push', 'Pull', 'Legs', 'Long Run',
+    'Push A', 'Push B', 'Pull A', 'Pull B', 'Legs A', 'Legs B',
+    'PushA', 'PushB', 'PullA', 'PullB', 'LegsA', 'LegsB',
+})
+
+# One parsed set; field order matches the Strong CSV sort order
+WorkoutSet = namedtuple(
+    'WorkoutSet',
+    ['date', 'workout_name', 'exercise_name', 'set_order', 'weight', 'reps', 'notes']
+)
+
+# Exercise name mapping - grouped by Hevy name with source name variations.
+# Read-only because _REVERSE_EXERCISE_MAP is built from it once at import;
+# edit the entries here rather than mutating the map at runtime.
+EXERCISE_NAME_MAP = MappingProxyType({
     "Bench Press (Barbell)": ["Flat Bench Press"],
     "Bench Press (Dumbbell)": ["DB Flat Bench"],
     "Calf Press (Machine)": ["Calf Raise", "Calf Raises"],
@@ -48,6 +95,14 @@ EXERCISE_NAME_MAP = {
     "Straight Leg Deadlift": ["SLDL"],
     "Triceps Rope Pushdown": ["Tricep Pushdown", "Tricep Pushdowns", "Tricep Rope Extension"],
     "Wide Pull Up": ["Wide Grip Pull-up"],
+})
+
+# Flattened source name -> Hevy name lookup, built once at import. Iterating in
+# reverse keeps the first matching Hevy name if a source name is listed twice.
+_REVERSE_EXERCISE_MAP = {
+    source_name: hevy_name
+    for hevy_name, source_names in reversed(EXERCISE_NAME_MAP.items())
+    for source_name in source_names
 }
 
 
@@ -61,10 +116,7 @@ def get_mapped_exercise_name(source_name: str) -> str:
     Returns:
         Mapped Hevy exercise name, or original name if no mapping exists
     """
-    for hevy_name, source_names in EXERCISE_NAME_MAP.items():
-        if source_name in source_names:
-            return hevy_name
-    return source_name
+    return _REVERSE_EXERCISE_MAP.get(source_name, source_name)
 
 
 def get_week_columns(header_row: list[str]) -> dict[int, int]:
@@ -79,10 +131,18 @@ def get_week_columns(header_row: list[str]) -> dict[int, int]:
     """
     week_map = {}
     for idx, cell in enumerate(header_row):
-        cell_str = str(cell).strip()
-        if 'Setup' in cell_str:
+        cell_str = cell.strip()  # csv.reader already yields str
+        if not cell_str or 'Setup' in cell_str:
             continue
-        week_match = re.search(r'Week\s*(\d+)', cell_str, re.IGNORECASE)
+        
+        # Fast path for the usual "Week N" / "Week N (dates)" cells
+        if cell_str[:4].lower() == 'week':
+            number = cell_str[4:].lstrip().partition(' ')[0]
+            if number.isdecimal():
+                week_map[int(number)] = idx
+                continue
+        
+        week_match = _WEEK_RE.search(cell_str)
         if week_match:
             week_map[int(week_match.group(1))] = idx
     return week_map
@@ -112,6 +172,39 @@ def calculate_date_backwards(
     return end_date - timedelta(days=days_back)
 
 
+def _parse_count(cell: str) -> int:
+    """
+    Parse a sets/reps cell.
+    
+    Args:
+        cell: Raw cell text
+        
+    Returns:
+        The whole number in the cell, or 0 if it is blank or not a plain number
+    """
+    # isdecimal check avoids raising ValueError on cells like "AMRAP"
+    if not cell.isdecimal():
+        cell = cell.strip()
+        if not cell.isdecimal():
+            return 0
+    return int(cell)
+
+
+def _parse_weight(cell: str) -> float:
+    """
+    Parse a weight cell.
+    
+    Args:
+        cell: Raw cell text
+        
+    Returns:
+        The number in the cell, or 0 if it is blank or not a plain number
+    """
+    if cell and (_FLOAT_RE.fullmatch(cell) or _FLOAT_RE.fullmatch(cell.strip())):
+        return float(cell)  # float() ignores surrounding whitespace
+    return 0
+
+
 def parse_health_tracking_csv(
     filepath: str,
     end_date: datetime,
@@ -119,7 +212,7 @@ def parse_health_tracking_csv(
     cycle_days: int = 8,
     workout_days_in_cycle: list[tuple[int, str]] = None,
     total_weeks: int = None
-) -> list[dict]:
+) -> list[WorkoutSet]:
     """
     Parse a health tracking CSV file organized by weeks.
     
@@ -132,165 +225,174 @@ def parse_health_tracking_csv(
         total_weeks: Total number of weeks (auto-detected if not provided)
     
     Returns:
-        List of workout entries in Strong CSV format
+        List of WorkoutSet records, one per set
     """
     if workout_days_in_cycle is None:
         workout_days_in_cycle = [(0, "Push"), (1, "Pull"), (2, "Legs")]
     
     workouts = []
     set_order_counter = {}
+    # Sets, reps and weights repeat heavily (3 sets, 8-12 reps, 135 lbs...), so
+    # each distinct cell text is parsed once and looked up afterwards
+    count_cache = {}
+    weight_cache = {}
     
-    with open(filepath, 'r', encoding='utf-8') as f:
+    # Stream rows straight from the reader rather than loading the whole file
+    with open(filepath, 'r', newline='', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
         reader = csv.reader(f)
-        rows = list(reader)
-    
-    if len(rows) < 2:
-        return workouts
-    
-    header_row = rows[0]
-    week_columns = get_week_columns(header_row)
-    
-    # Auto-detect total_weeks if not provided
-    if total_weeks is None:
-        total_weeks = max(week_columns.keys()) if week_columns else 0
-    
-    current_workout_day = None
-    
-    for row in rows[2:]:  # Skip header and subheader rows
-        if not row or not row[0].strip():
-            continue
-        
-        first_cell = row[0].strip()
-        
-        # Detect workout day headers (Day 1, Upper, Push A, etc.)
-        if first_cell.startswith('Day') or first_cell in ['Upper', 'Lower', 'Push', 'Pull', 'Legs', 'Long Run']:
-            current_workout_day = first_cell
-            continue
-        
-        # Check for variations like "Push A", "Push B"
-        for day_type in ['Push', 'Pull', 'Legs']:
-            if first_cell.startswith(day_type):
-                current_workout_day = first_cell
-                break
+        header_row = next(reader, None)
+        if header_row is None:
+            return workouts
+        next(reader, None)  # Skip subheader row
         
-        if not current_workout_day:
-            continue
-        
-        exercise_name = first_cell
+        week_columns = get_week_columns(header_row)
         
-        # Find matching workout configuration from cycle
-        workout_base = None
-        workout_day_index = None
+        # Auto-detect total_weeks if not provided
+        if total_weeks is None:
+            total_weeks = max(week_columns.keys()) if week_columns else 0
         
-        for day_index, day_name in workout_days_in_cycle:
-            if day_name in current_workout_day:
-                workout_base = day_name
-                workout_day_index = day_index
-                break
+        # Data columns after "Week X" are: Reps, Weight, Completed, Notes.
+        # Resolve every week's column indices once instead of per row.
+        week_column_plan = [
+            (week_num, col_idx, col_idx + 1, col_idx + 2, col_idx + 3, col_idx + 4)
+            for week_num, col_idx in week_columns.items()
+        ]
+        # Rows are padded to this width so week cells can be indexed without bounds checks
+        row_width = max((notes_idx for *_, notes_idx in week_column_plan), default=-1) + 1
         
-        if workout_base is None:
-            continue
+        current_workout_day = None
+        # Day header -> (full workout name, {week_num: 'YYYY-MM-DD 17:30:00'}), or () if not in the cycle
+        day_configs = {}
         
-        # Process each week column
-        for week_num, col_idx in week_columns.items():
-            if col_idx >= len(row):
+        for row in reader:
+            # Blank first cells are rejected before stripping; strip() then runs once
+            # and returns the cell itself when there is no padding to remove
+            if not row or not row[0]:
                 continue
             
-            # Parse sets
-            sets_cell = row[col_idx].strip()
-            if not sets_cell:
+            first_cell = row[0].strip()
+            if not first_cell:
                 continue
             
-            try:
-                sets = int(sets_cell)
-            except ValueError:
+            # Detect workout day headers (Day 1, Upper, Push A, etc.)
+            if first_cell in _DAY_HEADERS or first_cell.startswith('Day'):
+                current_workout_day = first_cell
                 continue
             
-            if sets == 0:
+            if not current_workout_day:
                 continue
             
-            # Data columns after "Week X" are: Reps, Weight, Completed, Notes
-            reps_idx = col_idx + 1
-            weight_idx = col_idx + 2
-            completed_idx = col_idx + 3
-            notes_idx = col_idx + 4
+            # Map to the Hevy name once per exercise row rather than once per written set
+            exercise_name = get_mapped_exercise_name(first_cell)
             
-            # Parse reps
-            reps = None
-            if reps_idx < len(row):
-                reps_val = row[reps_idx].strip()
-                if reps_val:
-                    try:
-                        reps = int(reps_val)
-                    except ValueError:
-                        pass
+            # Find matching workout configuration from cycle. Everything that depends
+            # only on the day (name, per-week dates) is resolved once per day header.
+            day_config = day_configs.get(current_workout_day)
+            if day_config is None:
+                day_config = ()
+                for workout_day_index, workout_base in workout_days_in_cycle:
+                    if workout_base in current_workout_day:
+                        week_dates = {
+                            week_num: calculate_date_backwards(
+                                week_num,
+                                workout_day_index,
+                                end_date,
+                                cycle_days,
+                                total_weeks
+                            ).strftime('%Y-%m-%d 17:30:00')
+                            for week_num in week_columns
+                        }
+                        day_config = (f"{workout_name_prefix} - {workout_base}", week_dates)
+                        break
+                day_configs[current_workout_day] = day_config
             
-            if not reps:
+            if not day_config:
                 continue
             
-            # Check if exercise was completed (TRUE in completed column)
-            if completed_idx < len(row):
-                completed_val = row[completed_idx].strip().upper()
-                if completed_val != 'TRUE':
-                    continue
-            
-            # Parse weight
-            weight = 0
-            if weight_idx < len(row):
-                weight_val = row[weight_idx].strip()
-                if weight_val and weight_val.upper() != 'N/A':
-                    try:
-                        weight = float(weight_val)
-                    except ValueError:
-                        pass
-            
-            # Parse notes (filter out YES/NO markers)
-            notes = ""
-            if notes_idx < len(row):
-                notes_val = row[notes_idx].strip()
-                if notes_val.upper() not in ('YES', 'NO', ''):
-                    notes = notes_val
-            
-            # Calculate date
-            workout_date = calculate_date_backwards(
-                week_num,
-                workout_day_index,
-                end_date,
-                cycle_days,
-                total_weeks
-            )
-            
-            full_workout_name = f"{workout_name_prefix} - {workout_base}"
-            date_key = workout_date.strftime('%Y-%m-%d')
-            exercise_key = (date_key, full_workout_name, exercise_name)
+            full_workout_name, week_dates = day_config
             
-            # Track set order per exercise per workout
-            current_set_order = set_order_counter.get(exercise_key, 0)
+            # Rows that end before a week's completed column are not filtered on it,
+            # so remember the real width before padding
+            row_len = len(row)
+            if row_len < row_width:
+                row = row + [''] * (row_width - row_len)
             
-            # Create entries for each set
-            for set_num in range(sets):
-                current_set_order += 1
-                workouts.append({
-                    'Date': f"{date_key} 17:30:00",
-                    'Workout Name': full_workout_name,
-                    'Exercise Name': exercise_name,
-                    'Set Order': current_set_order,
-                    'Weight': weight,
-                    'Reps': reps,
-                    'Notes': notes if set_num == 0 else ''
-                })
-            
-            set_order_counter[exercise_key] = current_set_order
+            # Process each week column
+            for week_num, col_idx, reps_idx, weight_idx, completed_idx, notes_idx in week_column_plan:
+                # Skip uncompleted weeks before parsing anything (TRUE in completed column)
+                if completed_idx < row_len:
+                    completed_val = row[completed_idx]
+                    completed = _COMPLETED_FLAGS.get(completed_val)
+                    if completed is None:
+                        completed = completed_val.strip().upper() == 'TRUE'
+                    if not completed:
+                        continue
+                
+                # Parse sets (blank or non-numeric cells parse as 0 and are skipped)
+                sets_cell = row[col_idx]
+                sets = count_cache.get(sets_cell)
+                if sets is None:
+                    sets = count_cache[sets_cell] = _parse_count(sets_cell)
+                if sets == 0:
+                    continue
+                
+                # Parse reps
+                reps_val = row[reps_idx]
+                reps = count_cache.get(reps_val)
+                if reps is None:
+                    reps = count_cache[reps_val] = _parse_count(reps_val)
+                if reps == 0:
+                    continue
+                
+                # Parse weight
+                weight_val = row[weight_idx]
+                weight = weight_cache.get(weight_val)
+                if weight is None:
+                    weight = weight_cache[weight_val] = _parse_weight(weight_val)
+                
+                # Parse notes (filter out YES/NO markers)
+                notes = ""
+                notes_val = row[notes_idx]
+                if notes_val not in _NOTE_MARKERS:
+                    notes_val = notes_val.strip()
+                    # Only short cells can be an oddly cased YES/NO, so prose skips upper()
+                    if notes_val not in _NOTE_MARKERS and (
+                        len(notes_val) > 3 or notes_val.upper() not in ('YES', 'NO')
+                    ):
+                        notes = notes_val
+                
+                date_with_time = week_dates[week_num]
+                exercise_key = (date_with_time, full_workout_name, exercise_name)
+                
+                # Track set order per exercise per workout
+                first_set_order = set_order_counter.get(exercise_key, 0) + 1
+                end_set_order = first_set_order + sets
+                
+                # Expand all sets for this week in one pass; only the first set carries notes
+                workouts.extend(
+                    WorkoutSet(
+                        date_with_time,
+                        full_workout_name,
+                        exercise_name,
+                        set_order,
+                        weight,
+                        reps,
+                        notes if set_order == first_set_order else ''
+                    )
+                    for set_order in range(first_set_order, end_set_order)
+                )
+                
+                set_order_counter[exercise_key] = end_set_order - 1
     
     return workouts
 
 
-def write_strong_csv(workouts: list[dict], output_path: str):
+def write_strong_csv(workouts: Iterable[WorkoutSet], output_path: str):
     """
     Write workouts to Strong CSV format (semicolon-delimited).
     
     Args:
-        workouts: List of workout entries
+        workouts: Iterable of WorkoutSet records, already in output order
         output_path: Output CSV file path
     """
     fieldnames = [
@@ -299,37 +401,103 @@ def write_strong_csv(workouts: list[dict], output_path: str):
         'Workout Notes', 'Workout Duration'
     ]
     
-    # Sort by date, workout, exercise, and set order
-    workouts_sorted = sorted(
-        workouts, 
-        key=lambda x: (x['Date'], x['Workout Name'], x['Exercise Name'], x['Set Order'])
-    )
-    
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=';')
-        writer.writeheader()
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(fieldnames)
+        write = f.write
         
-        for workout in workouts_sorted:
-            exercise_name = workout['Exercise Name']
-            mapped_name = get_mapped_exercise_name(exercise_name)
+        for workout in workouts:
+            notes = workout.notes or '-'
             
-            row = {
-                'Date': workout['Date'],
-                'Workout Name': workout['Workout Name'],
-                'Exercise Name': mapped_name,
-                'Set Order': workout['Set Order'],
-                'Weight': workout['Weight'],
-                'Weight Unit': 'lbs',
-                'Reps': workout['Reps'],
-                'RPE': '',
-                'Distance': '',
-                'Distance Unit': '',
-                'Seconds': '0',
-                'Notes': workout.get('Notes') or '-',
-                'Workout Notes': '-',
-                'Workout Duration': '1h'
-            }
-            writer.writerow(row)
+            # Free text with a delimiter, quote or newline goes through csv for quoting
+            if (
+                _NEEDS_QUOTING_RE.search(workout.workout_name)
+                or _NEEDS_QUOTING_RE.search(workout.exercise_name)
+                or _NEEDS_QUOTING_RE.search(notes)
+            ):
+                writer.writerow((
+                    workout.date,
+                    workout.workout_name,
+                    workout.exercise_name,
+                    workout.set_order,
+                    workout.weight,
+                    'lbs',                  # Weight Unit
+                    workout.reps,
+                    '',                     # RPE
+                    '',                     # Distance
+                    '',                     # Distance Unit
+                    '0',                    # Seconds
+                    notes,
+                    '-',                    # Workout Notes
+                    '1h'                    # Workout Duration
+                ))
+                continue
+            
+            # Everything else needs no escaping, so format the row directly with the
+            # constant columns baked in (same layout and \r\n terminator as csv.writer)
+            write(
+                f"{workout.date};{workout.workout_name};{workout.exercise_name};"
+                f"{workout.set_order};{workout.weight};lbs;{workout.reps};;;;0;"
+                f"{notes};-;1h\r\n"
+            )
+
+
+def parse_file_config(config: dict) -> tuple[list[WorkoutSet], int]:
+    """
+    Parse one input file using the cycle layout for its workout program.
+    
+    Args:
+        config: Dict with 'filepath', 'end_date', 'workout_name'
+        
+    Returns:
+        Tuple of (sorted WorkoutSet records, cycle length in days)
+    """
+    filepath = config['filepath']
+    end_date = config['end_date']
+    workout_name = config.get('workout_name', 'PPL')
+    
+    # Define cycle parameters
+    # IMPORTANT: end_date is the LAST workout date (anchor point)
+    # workout_days tuples are (days_back, workout_name)
+    
+    if workout_name == "ULPPL":
+        # ULPPL: 7-day cycle: Upper(0), Lower(1), Rest(2), Push(3), Pull(4), Legs(5), Rest(6)
+        # End date = Upper (last Upper in the program = Feb 13)
+        # Upper is day 0, so offset 0 means it lands on end_date
+        # Other workouts have negative offsets to come AFTER Upper chronologically
+        cycle_days = 7
+        workout_days = [
+            (0, "Upper"),   # Upper is day 0: end_date (Feb 13)
+            (-1, "Lower"),  # Lower is day 1: 1 day after Upper
+            (-3, "Push"),   # Push is day 3: 3 days after Upper  
+            (-4, "Pull"),   # Pull is day 4: 4 days after Upper
+            (-5, "Legs"),   # Legs is day 5: 5 days after Upper
+        ]
+    else:  # PPL
+        # PPL: 8-day cycle: Push A, Pull A, Legs A, Rest, Push B, Pull B, Legs B, Rest
+        # End date = Legs B (day 6 of cycle)
+        cycle_days = 8
+        workout_days = [
+            (6, "Push A"),  # 6 days back from end_date
+            (5, "Pull A"),  # 5 days back
+            (4, "Legs A"),  # 4 days back
+            (2, "Push B"),  # 2 days back
+            (1, "Pull B"),  # 1 day back
+            (0, "Legs B"),  # 0 days back (end_date)
+        ]
+    
+    workouts = parse_health_tracking_csv(
+        filepath,
+        end_date,
+        workout_name_prefix=workout_name,
+        cycle_days=cycle_days,
+        workout_days_in_cycle=workout_days
+    )
+    # Sort by date, workout, exercise, and set order (the leading WorkoutSet
+    # fields, so plain tuple comparison needs no key function). Doing it here
+    # lets each worker sort its own file; merge_csv_files only merges the runs.
+    workouts.sort()
+    return workouts, cycle_days
 
 
 def merge_csv_files(file_configs: list[dict], output_path: str):
@@ -340,61 +508,41 @@ def merge_csv_files(file_configs: list[dict], output_path: str):
         file_configs: List of dicts with 'filepath', 'end_date', 'workout_name'
         output_path: Output CSV file path
     """
-    all_workouts = []
-    
+    valid_configs = []
     for config in file_configs:
-        filepath = config['filepath']
-        end_date = config['end_date']
-        workout_name = config.get('workout_name', 'PPL')
-        
-        if end_date is None:
-            print(f"Error: No end_date provided for {filepath}")
+        if config['end_date'] is None:
+            print(f"Error: No end_date provided for {config['filepath']}")
             continue
-        
-        # Define cycle parameters
-        # IMPORTANT: end_date is the LAST workout date (anchor point)
-        # workout_days tuples are (days_back, workout_name)
-        
-        if workout_name == "ULPPL":
-            # ULPPL: 7-day cycle: Upper(0), Lower(1), Rest(2), Push(3), Pull(4), Legs(5), Rest(6)
-            # End date = Upper (last Upper in the program = Feb 13)
-            # Upper is day 0, so offset 0 means it lands on end_date
-            # Other workouts have negative offsets to come AFTER Upper chronologically
-            cycle_days = 7
-            workout_days = [
-                (0, "Upper"),   # Upper is day 0: end_date (Feb 13)
-                (-1, "Lower"),  # Lower is day 1: 1 day after Upper
-                (-3, "Push"),   # Push is day 3: 3 days after Upper  
-                (-4, "Pull"),   # Pull is day 4: 4 days after Upper
-                (-5, "Legs"),   # Legs is day 5: 5 days after Upper
-            ]
-        else:  # PPL
-            # PPL: 8-day cycle: Push A, Pull A, Legs A, Rest, Push B, Pull B, Legs B, Rest
-            # End date = Legs B (day 6 of cycle)
-            cycle_days = 8
-            workout_days = [
-                (6, "Push A"),  # 6 days back from end_date
-                (5, "Pull A"),  # 5 days back
-                (4, "Legs A"),  # 4 days back
-                (2, "Push B"),  # 2 days back
-                (1, "Pull B"),  # 1 day back
-                (0, "Legs B"),  # 0 days back (end_date)
-            ]
-        
-        workouts = parse_health_tracking_csv(
-            filepath,
-            end_date,
-            workout_name_prefix=workout_name,
-            cycle_days=cycle_days,
-            workout_days_in_cycle=workout_days
-        )
-        
-        all_workouts.extend(workouts)
-        print(f"Processed {filepath}: {len(workouts)} sets (end_date={end_date.strftime('%Y-%m-%d')}, {cycle_days}-day cycle)")
+        valid_configs.append(config)
+    
+    # Files are independent, so parse them in worker processes when there are
+    # several, more than one CPU, and enough input to outweigh process start-up
+    if (
+        len(valid_configs) > 1
+        and (os.cpu_count() or 1) > 1
+        and sum(os.path.getsize(config['filepath']) for config in valid_configs) >= _PARALLEL_MIN_BYTES
+    ):
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(parse_file_config, valid_configs))
+    else:
+        results = [parse_file_config(config) for config in valid_configs]
+    
+    total_sets = 0
+    
+    for config, (workouts, cycle_days) in zip(valid_configs, results):
+        total_sets += len(workouts)
+        print(f"Processed {config['filepath']}: {len(workouts)} sets (end_date={config['end_date'].strftime('%Y-%m-%d')}, {cycle_days}-day cycle)")
     
-    if all_workouts:
-        write_strong_csv(all_workouts, output_path)
-        print(f"\nTotal: {len(all_workouts)} sets written to {output_path}")
+    if total_sets:
+        # Each file's sets are already sorted, so a k-way merge yields the global
+        # order without concatenating and re-sorting everything. A single file
+        # is written straight from its list.
+        if len(results) == 1:
+            sorted_workouts = results[0][0]
+        else:
+            sorted_workouts = heapq.merge(*(workouts for workouts, _ in results))
+        write_strong_csv(sorted_workouts, output_path)
+        print(f"\nTotal: {total_sets} sets written to {output_path}")
     else:
         print("No workouts found.")
 